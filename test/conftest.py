@@ -10,6 +10,8 @@ def pytest_configure(config):
     # register an additional marker (see pytest_collection_modifyitems)
     config.addinivalue_line("markers", "needs_cuda: mark for tests that rely on a CUDA device")
     config.addinivalue_line("markers", "dont_collect: mark for tests that should not be collected")
+    # pytest-xdist registers this marker itself, but it is not a hard requirement for running the test suite
+    config.addinivalue_line("markers", "xdist_group: mark for tests that should run on the same pytest-xdist worker")
 
 
 def pytest_collection_modifyitems(items):